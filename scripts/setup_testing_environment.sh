@@ -58,7 +58,7 @@ install_python_dependencies() {
         echo -e "${GREEN}✓ Python dependencies installed${NC}"
     else
         echo -e "${YELLOW}requirements.txt not found, installing basic packages...${NC}"
-        pip3 install matplotlib pandas numpy seaborn
+        pip3 install matplotlib pandas numpy orjson
         echo -e "${GREEN}✓ Basic Python packages installed${NC}"
     fi
 }
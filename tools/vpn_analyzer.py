@@ -8,16 +8,190 @@ import json
 import os
 import sys
 import argparse
-import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import seaborn as sns
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Six evenly spaced HUSL hues, matching seaborn's "husl" palette
+HUSL_COLORS = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+
+# Result file name prefixes for each kind of test
+TEST_PREFIXES = ('ping_', 'iperf_')
+
+def _json_loads(content):
+    """Parse JSON with orjson when available, falling back to json for NaN/Infinity"""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+# Result fields read by the analyzers; only these are loaded and cached
+RESULT_FIELDS = ('avg_ping_ms', 'min_ping_ms', 'max_ping_ms', 'packet_loss_percent',
+                 'bandwidth_mbps', 'direction')
+
+def _read_json(file_path):
+    """Read and parse a single result file, returning None if it is empty"""
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    # isspace() checks in place rather than building a stripped copy
+    if not content or content.isspace():
+        return None
+    return _json_loads(content)
+
+def _result_row(payload):
+    """Reduce a parsed result file to a tuple of its RESULT_FIELDS values"""
+    return tuple(payload.get(field) for field in RESULT_FIELDS)
+
+def _row_record(row):
+    """Turn a result row back into a dict, leaving out missing fields"""
+    return {field: value for field, value in zip(RESULT_FIELDS, row) if value is not None}
+
+def _load_cache(cache_path):
+    """Load the result cache as {key: (mtime_ns, row)}, or {} if it is missing or unusable"""
+    try:
+        with open(cache_path, 'rb') as f:
+            table = _json_loads(f.read())
+        columns = [table[name] for name in ('key', 'mtime_ns') + RESULT_FIELDS]
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+    keys, mtimes, *values = columns
+    if not all(isinstance(column, list) and len(column) == len(keys) for column in columns):
+        return {}
+    if not all(isinstance(key, str) for key in keys):
+        return {}
+    return {key: (mtime_ns, row) for key, mtime_ns, row in zip(keys, mtimes, zip(*values))}
+
+def _save_cache(cache_path, cache):
+    """Atomically write the result cache as one column per field"""
+    keys = list(cache)
+    table = {'key': keys, 'mtime_ns': [cache[key][0] for key in keys]}
+    for index, field in enumerate(RESULT_FIELDS):
+        table[field] = [cache[key][1][index] for key in keys]
+    
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        # The stdlib encoder keeps NaN/Infinity, which orjson would turn into null
+        content = json.dumps(table)
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not write cache {cache_path}: {e}")
+
+def _scan_results(baseline_dir, vpn_dir, test_type):
+    """List (bucket, test_name, path, cache_key, mtime_ns) for each result file"""
+    suffix = f"_{test_type}.txt"
+    tasks = []
+    for bucket, results_dir in (('baseline', baseline_dir), ('vpn', vpn_dir)):
+        try:
+            entries = os.scandir(results_dir)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    test_name = entry.name[:-len(suffix)]
+                    cache_key = f"{bucket}/{entry.name}"
+                    mtime_ns = entry.stat().st_mtime_ns
+                    tasks.append((bucket, test_name, entry.path, cache_key, mtime_ns))
+    return tasks
+
+def _bounded_submit(tasks, submit, window_size):
+    """Yield (task, submit(task)) in task order, submitting at most window_size ahead"""
+    queued = deque()
+    for task in tasks:
+        queued.append((task, submit(task)))
+        if len(queued) >= window_size:
+            yield queued.popleft()
+    while queued:
+        yield queued.popleft()
+
+def _iter_results(tasks, cache_path):
+    """Yield (bucket, test_name, result) for each task, reusing cached rows where fresh"""
+    cache = _load_cache(cache_path)
+    fresh_cache = {}
+    changed = False
+    
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def submit_stale(task):
+            cached = cache.get(task[3])
+            if cached is not None and cached[0] == task[4]:
+                return None
+            return executor.submit(_read_json, task[2])
+        
+        # Parse new or modified files through a sliding window, so only a few
+        # raw payloads are alive at once; report errors from this thread
+        for task, future in _bounded_submit(tasks, submit_stale, max_workers * 4):
+            bucket, test_name, file_path, cache_key, mtime_ns = task
+            if future is None:
+                row = cache[cache_key][1]
+            else:
+                try:
+                    payload = future.result()
+                except (json.JSONDecodeError, FileNotFoundError) as e:
+                    print(f"Warning: Could not load {file_path}: {e}")
+                    continue
+                if payload is None:
+                    continue
+                if not isinstance(payload, dict):
+                    print(f"Warning: Could not load {file_path}: expected a JSON object")
+                    continue
+                row = _result_row(payload)
+                changed = True
+            fresh_cache[cache_key] = (mtime_ns, row)
+            yield bucket, test_name, _row_record(row)
+    
+    # Once exhausted, rewrite the cache only when rows were added, updated or removed
+    if changed or fresh_cache.keys() != cache.keys():
+        _save_cache(cache_path, fresh_cache)
+
+@lru_cache(maxsize=8)
+def _load_test_data(tasks, cache_path):
+    """Collect the results of scanned tasks by bucket; tasks carry each file's mtime"""
+    data = {
+        'baseline': {},
+        'vpn': {}
+    }
+    
+    for bucket, test_name, result in _iter_results(tasks, cache_path):
+        data[bucket][test_name] = result
+    
+    return data
+
+def _pair_results(results):
+    """Group the tests present in both buckets by type prefix from a stream of results"""
+    paired = {bucket: {prefix: {} for prefix in TEST_PREFIXES} for bucket in ('baseline', 'vpn')}
+    unpaired = {'baseline': {}, 'vpn': {}}
+    for bucket, test_name, result in results:
+        # Classify each test once; tests of unknown type are never buffered
+        prefix = next((p for p in TEST_PREFIXES if test_name.startswith(p)), None)
+        if prefix is None:
+            continue
+        other = 'vpn' if bucket == 'baseline' else 'baseline'
+        match = unpaired[other].pop(test_name, None)
+        if match is None:
+            unpaired[bucket][test_name] = result
+        else:
+            paired[bucket][prefix][test_name] = result
+            paired[other][prefix][test_name] = match
+    return paired
 
 class VPNAnalyzer:
-    def __init__(self, results_dir="../results"):
+    def __init__(self, results_dir="../results", chart_dpi=150):
         self.results_dir = Path(results_dir)
+        self.chart_dpi = chart_dpi
         self.baseline_dir = self.results_dir / "baseline"
         self.vpn_dir = self.results_dir / "vpn"
         self.analysis_dir = self.results_dir / "analysis"
@@ -25,121 +199,124 @@ class VPNAnalyzer:
         # Create directories if they don't exist
         self.analysis_dir.mkdir(parents=True, exist_ok=True)
         
-        # Set up plotting style
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
+        # Plotting libraries are imported on first chart to keep startup fast
+        self._style_ready = False
         
+    def iter_test_data(self, test_type="latest"):
+        """Yield (bucket, test_name, result) for each result file, in file order"""
+        tasks = _scan_results(self.baseline_dir, self.vpn_dir, test_type)
+        return _iter_results(tasks, self.analysis_dir / f"cache_{test_type}.json")
+    
     def load_test_data(self, test_type="latest"):
-        """Load test data from JSON files"""
-        data = {
-            'baseline': {},
-            'vpn': {}
-        }
-        
-        # Load baseline data
-        if self.baseline_dir.exists():
-            for file_path in self.baseline_dir.glob(f"*_{test_type}.txt"):
-                test_name = file_path.stem.replace(f"_{test_type}", "")
-                try:
-                    with open(file_path, 'r') as f:
-                        content = f.read().strip()
-                        if content:
-                            data['baseline'][test_name] = json.loads(content)
-                except (json.JSONDecodeError, FileNotFoundError) as e:
-                    print(f"Warning: Could not load {file_path}: {e}")
-        
-        # Load VPN data
-        if self.vpn_dir.exists():
-            for file_path in self.vpn_dir.glob(f"*_{test_type}.txt"):
-                test_name = file_path.stem.replace(f"_{test_type}", "")
-                try:
-                    with open(file_path, 'r') as f:
-                        content = f.read().strip()
-                        if content:
-                            data['vpn'][test_name] = json.loads(content)
-                except (json.JSONDecodeError, FileNotFoundError) as e:
-                    print(f"Warning: Could not load {file_path}: {e}")
-        
-        return data
+        """Load test data from JSON files, reusing it while no result file has changed"""
+        # Adding, removing or editing a result file changes the scan and misses the memo
+        tasks = tuple(_scan_results(self.baseline_dir, self.vpn_dir, test_type))
+        data = _load_test_data(tasks, self.analysis_dir / f"cache_{test_type}.json")
+        
+        # Copy each result so callers cannot modify the memoized data
+        return {bucket: {test_name: dict(result) for test_name, result in tests.items()}
+                for bucket, tests in data.items()}
+    
+    @staticmethod
+    def _display_names(index, prefix):
+        """Turn test names like 'ping_new_york' into chart labels like 'New York'"""
+        return (index.str.replace(prefix, '', regex=False)
+                .str.replace('_', ' ', regex=False)
+                .str.title()
+                .tolist())
     
-    def analyze_latency(self, data):
-        """Analyze latency performance"""
-        results = {}
-        
-        # Find matching ping tests
-        baseline_ping = {k: v for k, v in data['baseline'].items() if k.startswith('ping_')}
-        vpn_ping = {k: v for k, v in data['vpn'].items() if k.startswith('ping_')}
-        
-        for test_name in baseline_ping:
-            if test_name in vpn_ping:
-                baseline = baseline_ping[test_name]
-                vpn = vpn_ping[test_name]
-                
-                # Calculate overhead
-                overhead_ms = vpn['avg_ping_ms'] - baseline['avg_ping_ms']
-                overhead_percent = (overhead_ms / baseline['avg_ping_ms']) * 100
-                
-                results[test_name] = {
-                    'baseline_avg': baseline['avg_ping_ms'],
-                    'vpn_avg': vpn['avg_ping_ms'],
-                    'overhead_ms': overhead_ms,
-                    'overhead_percent': overhead_percent,
-                    'baseline_min': baseline['min_ping_ms'],
-                    'baseline_max': baseline['max_ping_ms'],
-                    'vpn_min': vpn['min_ping_ms'],
-                    'vpn_max': vpn['max_ping_ms'],
-                    'baseline_loss': baseline['packet_loss_percent'],
-                    'vpn_loss': vpn['packet_loss_percent']
-                }
+    def analyze_latency(self, baseline_tests, vpn_tests):
+        """Analyze latency performance from baseline and VPN ping tests"""
+        baseline_ping = pd.DataFrame.from_dict(baseline_tests, orient='index')
+        vpn_ping = pd.DataFrame.from_dict(vpn_tests, orient='index')
+        if baseline_ping.empty or vpn_ping.empty:
+            return pd.DataFrame()
+        
+        columns = ['avg_ping_ms', 'min_ping_ms', 'max_ping_ms', 'packet_loss_percent']
+        joined = baseline_ping[columns].join(
+            vpn_ping[columns], lsuffix='_baseline', rsuffix='_vpn', how='inner'
+        )
+        
+        # Calculate overhead
+        overhead_ms = joined['avg_ping_ms_vpn'] - joined['avg_ping_ms_baseline']
+        overhead_percent = (overhead_ms / joined['avg_ping_ms_baseline']) * 100
+        
+        results = pd.DataFrame({
+            'baseline_avg': joined['avg_ping_ms_baseline'],
+            'vpn_avg': joined['avg_ping_ms_vpn'],
+            'overhead_ms': overhead_ms,
+            'overhead_percent': overhead_percent,
+            'baseline_min': joined['min_ping_ms_baseline'],
+            'baseline_max': joined['max_ping_ms_baseline'],
+            'vpn_min': joined['min_ping_ms_vpn'],
+            'vpn_max': joined['max_ping_ms_vpn'],
+            'baseline_loss': joined['packet_loss_percent_baseline'],
+            'vpn_loss': joined['packet_loss_percent_vpn']
+        })
         
         return results
     
-    def analyze_bandwidth(self, data):
-        """Analyze bandwidth performance"""
-        results = {}
-        
-        # Find matching iperf tests
-        baseline_iperf = {k: v for k, v in data['baseline'].items() if k.startswith('iperf_')}
-        vpn_iperf = {k: v for k, v in data['vpn'].items() if k.startswith('iperf_')}
-        
-        for test_name in baseline_iperf:
-            if test_name in vpn_iperf:
-                baseline = baseline_iperf[test_name]
-                vpn = vpn_iperf[test_name]
-                
-                # Calculate bandwidth ratio
-                bandwidth_ratio = vpn['bandwidth_mbps'] / baseline['bandwidth_mbps']
-                bandwidth_loss_percent = (1 - bandwidth_ratio) * 100
-                
-                results[test_name] = {
-                    'baseline_mbps': baseline['bandwidth_mbps'],
-                    'vpn_mbps': vpn['bandwidth_mbps'],
-                    'bandwidth_ratio': bandwidth_ratio,
-                    'bandwidth_loss_percent': bandwidth_loss_percent,
-                    'direction': baseline.get('direction', 'unknown')
-                }
+    def analyze_bandwidth(self, baseline_tests, vpn_tests):
+        """Analyze bandwidth performance from baseline and VPN iperf tests"""
+        baseline_iperf = pd.DataFrame.from_dict(baseline_tests, orient='index')
+        vpn_iperf = pd.DataFrame.from_dict(vpn_tests, orient='index')
+        if baseline_iperf.empty or vpn_iperf.empty:
+            return pd.DataFrame()
+        
+        joined = baseline_iperf[['bandwidth_mbps']].join(
+            vpn_iperf[['bandwidth_mbps']], lsuffix='_baseline', rsuffix='_vpn', how='inner'
+        )
+        direction = baseline_iperf.get('direction', pd.Series('unknown', index=baseline_iperf.index))
+        
+        # Calculate bandwidth ratio
+        bandwidth_ratio = joined['bandwidth_mbps_vpn'] / joined['bandwidth_mbps_baseline']
+        bandwidth_loss_percent = (1 - bandwidth_ratio) * 100
+        
+        results = pd.DataFrame({
+            'baseline_mbps': joined['bandwidth_mbps_baseline'],
+            'vpn_mbps': joined['bandwidth_mbps_vpn'],
+            'bandwidth_ratio': bandwidth_ratio,
+            'bandwidth_loss_percent': bandwidth_loss_percent,
+            'direction': direction.reindex(joined.index).fillna('unknown')
+        })
         
         return results
     
-    def generate_latency_chart(self, latency_data):
-        """Generate latency comparison chart"""
-        if not latency_data:
-            print("No latency data available for charting")
+    def _setup_style(self):
+        """Set up plotting style"""
+        if self._style_ready:
             return
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
+        # Charts are only written to disk, so skip interactive backend probing,
+        # unless the host process (e.g. a notebook) already set up pyplot
+        if 'matplotlib.pyplot' not in sys.modules:
+            import matplotlib
+            matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        from cycler import cycler
+        
+        plt.style.use('default')
+        plt.rcParams.update({
+            'axes.facecolor': '#EAEAF2',
+            'axes.edgecolor': 'white',
+            'axes.linewidth': 0.0,
+            'axes.axisbelow': True,
+            'axes.grid': True,
+            'grid.color': 'white',
+            'legend.frameon': False,
+            'xtick.major.size': 0.0,
+            'ytick.major.size': 0.0,
+            'axes.prop_cycle': cycler(color=HUSL_COLORS),
+        })
+        self._style_ready = True
+    
+    def _plot_latency(self, ax1, ax2, latency_data):
+        """Draw latency comparison and overhead charts onto a pair of axes"""
         # Prepare data for plotting
-        test_names = []
-        baseline_avgs = []
-        vpn_avgs = []
-        overheads = []
-        
-        for test_name, data in latency_data.items():
-            test_names.append(test_name.replace('ping_', '').replace('_', ' ').title())
-            baseline_avgs.append(data['baseline_avg'])
-            vpn_avgs.append(data['vpn_avg'])
-            overheads.append(data['overhead_ms'])
+        latency_data = latency_data.sort_index()
+        test_names = self._display_names(latency_data.index, 'ping_')
+        baseline_avgs = latency_data['baseline_avg'].to_numpy()
+        vpn_avgs = latency_data['vpn_avg'].to_numpy()
+        overheads = latency_data['overhead_ms'].to_numpy()
         
         # Latency comparison chart
         x = np.arange(len(test_names))
@@ -157,7 +334,7 @@ class VPNAnalyzer:
         ax1.grid(True, alpha=0.3)
         
         # Overhead chart
-        colors = ['green' if x < 10 else 'orange' if x < 25 else 'red' for x in overheads]
+        colors = np.select([overheads < 10, overheads < 25], ['green', 'orange'], default='red').tolist()
         ax2.bar(test_names, overheads, color=colors, alpha=0.8)
         ax2.set_xlabel('Test Target')
         ax2.set_ylabel('Overhead (ms)')
@@ -168,35 +345,15 @@ class VPNAnalyzer:
         # Add threshold lines
         ax2.axhline(y=10, color='green', linestyle='--', alpha=0.7, label='Excellent (<10ms)')
         ax2.axhline(y=25, color='orange', linestyle='--', alpha=0.7, label='Good (<25ms)')
-        
-        plt.tight_layout()
-        
-        # Save chart
-        chart_path = self.analysis_dir / f"latency_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        print(f"Latency chart saved: {chart_path}")
-        
-        plt.show()
     
-    def generate_bandwidth_chart(self, bandwidth_data):
-        """Generate bandwidth comparison chart"""
-        if not bandwidth_data:
-            print("No bandwidth data available for charting")
-            return
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
+    def _plot_bandwidth(self, ax1, ax2, bandwidth_data):
+        """Draw bandwidth comparison and efficiency charts onto a pair of axes"""
         # Prepare data for plotting
-        test_names = []
-        baseline_mbps = []
-        vpn_mbps = []
-        ratios = []
-        
-        for test_name, data in bandwidth_data.items():
-            test_names.append(test_name.replace('iperf_', '').replace('_', ' ').title())
-            baseline_mbps.append(data['baseline_mbps'])
-            vpn_mbps.append(data['vpn_mbps'])
-            ratios.append(data['bandwidth_ratio'] * 100)
+        bandwidth_data = bandwidth_data.sort_index()
+        test_names = self._display_names(bandwidth_data.index, 'iperf_')
+        baseline_mbps = bandwidth_data['baseline_mbps'].to_numpy()
+        vpn_mbps = bandwidth_data['vpn_mbps'].to_numpy()
+        ratios = bandwidth_data['bandwidth_ratio'].to_numpy() * 100
         
         # Bandwidth comparison chart
         x = np.arange(len(test_names))
@@ -214,7 +371,7 @@ class VPNAnalyzer:
         ax1.grid(True, alpha=0.3)
         
         # Bandwidth ratio chart
-        colors = ['green' if x > 80 else 'orange' if x > 60 else 'red' for x in ratios]
+        colors = np.select([ratios > 80, ratios > 60], ['green', 'orange'], default='red').tolist()
         ax2.bar(test_names, ratios, color=colors, alpha=0.8)
         ax2.set_xlabel('Test Type')
         ax2.set_ylabel('VPN/Baseline Ratio (%)')
@@ -225,111 +382,151 @@ class VPNAnalyzer:
         # Add threshold lines
         ax2.axhline(y=80, color='green', linestyle='--', alpha=0.7, label='Excellent (>80%)')
         ax2.axhline(y=60, color='orange', linestyle='--', alpha=0.7, label='Good (>60%)')
+    
+    def _render_chart(self, panels, chart_name, label, now):
+        """Draw each (plot, data) panel as one row of a figure and save it once"""
+        self._setup_style()
+        import matplotlib.pyplot as plt
+        
+        fig, axes = plt.subplots(len(panels), 2, figsize=(15, 6 * len(panels)), squeeze=False)
+        for (plot, data), (ax1, ax2) in zip(panels, axes):
+            plot(ax1, ax2, data)
         
         plt.tight_layout()
         
         # Save chart
-        chart_path = self.analysis_dir / f"bandwidth_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        print(f"Bandwidth chart saved: {chart_path}")
+        chart_path = self.analysis_dir / f"{chart_name}_{now.strftime('%Y%m%d_%H%M%S')}.png"
+        plt.savefig(chart_path, dpi=self.chart_dpi, bbox_inches='tight',
+                    metadata={'Software': 'vpn_analyzer'})
+        print(f"{label} chart saved: {chart_path}")
         
-        plt.show()
+        plt.close(fig)
     
-    def generate_summary_report(self, latency_data, bandwidth_data):
-        """Generate comprehensive summary report"""
-        report_path = self.analysis_dir / f"comprehensive_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    def generate_combined_chart(self, latency_data, bandwidth_data, now=None):
+        """Generate latency and bandwidth charts as a single figure"""
+        panels = []
+        if not latency_data.empty:
+            panels.append((self._plot_latency, latency_data))
+        if not bandwidth_data.empty:
+            panels.append((self._plot_bandwidth, bandwidth_data))
+        
+        if not panels:
+            print("No data available for charting")
+            return
         
-        with open(report_path, 'w') as f:
-            f.write("WireGuard VPN Performance Analysis Report\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        self._render_chart(panels, 'performance_analysis', 'Performance', now or datetime.now())
+    
+    def generate_latency_chart(self, latency_data, now=None):
+        """Generate latency comparison chart"""
+        if latency_data.empty:
+            print("No latency data available for charting")
+            return
+        
+        self._render_chart([(self._plot_latency, latency_data)], 'latency_analysis', 'Latency',
+                           now or datetime.now())
+    
+    def generate_bandwidth_chart(self, bandwidth_data, now=None):
+        """Generate bandwidth comparison chart"""
+        if bandwidth_data.empty:
+            print("No bandwidth data available for charting")
+            return
+        
+        self._render_chart([(self._plot_bandwidth, bandwidth_data)], 'bandwidth_analysis', 'Bandwidth',
+                           now or datetime.now())
+    
+    def generate_summary_report(self, latency_data, bandwidth_data, now=None):
+        """Generate comprehensive summary report"""
+        now = now or datetime.now()
+        report_path = self.analysis_dir / f"comprehensive_report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
+        
+        lines = []
+        lines.append("WireGuard VPN Performance Analysis Report\n")
+        lines.append("=" * 50 + "\n")
+        lines.append(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        
+        # Latency Analysis
+        lines.append("LATENCY ANALYSIS\n")
+        lines.append("-" * 20 + "\n")
+        if not latency_data.empty:
+            # Performance ratings
+            overhead = latency_data['overhead_percent']
+            ratings = np.select([overhead < 10, overhead < 25], ['EXCELLENT', 'GOOD'],
+                                default='NEEDS IMPROVEMENT')
+            for row in latency_data.assign(rating=ratings).itertuples():
+                lines.append(f"\n{row.Index.replace('ping_', '').replace('_', ' ').title()}:\n")
+                lines.append(f"  Baseline Average: {row.baseline_avg:.2f}ms\n")
+                lines.append(f"  VPN Average: {row.vpn_avg:.2f}ms\n")
+                lines.append(f"  Overhead: +{row.overhead_ms:.2f}ms (+{row.overhead_percent:.1f}%)\n")
+                lines.append(f"  Rating: {row.rating}\n")
+        else:
+            lines.append("No latency data available\n")
+        
+        # Bandwidth Analysis
+        lines.append("\n\nBANDWIDTH ANALYSIS\n")
+        lines.append("-" * 20 + "\n")
+        if not bandwidth_data.empty:
+            # Performance ratings
+            ratio = bandwidth_data['bandwidth_ratio']
+            ratings = np.select([ratio > 0.8, ratio > 0.6], ['EXCELLENT', 'GOOD'],
+                                default='NEEDS IMPROVEMENT')
+            for row in bandwidth_data.assign(rating=ratings).itertuples():
+                lines.append(f"\n{row.Index.replace('iperf_', '').replace('_', ' ').title()}:\n")
+                lines.append(f"  Baseline: {row.baseline_mbps:.2f} Mbps\n")
+                lines.append(f"  VPN: {row.vpn_mbps:.2f} Mbps\n")
+                lines.append(f"  Efficiency: {row.bandwidth_ratio*100:.1f}%\n")
+                lines.append(f"  Rating: {row.rating}\n")
+        else:
+            lines.append("No bandwidth data available\n")
+        
+        # Overall Assessment
+        lines.append("\n\nOVERALL ASSESSMENT\n")
+        lines.append("-" * 20 + "\n")
+        
+        if not latency_data.empty and not bandwidth_data.empty:
+            avg_latency_overhead = latency_data['overhead_percent'].mean()
+            avg_bandwidth_efficiency = bandwidth_data['bandwidth_ratio'].mean()
             
-            # Latency Analysis
-            f.write("LATENCY ANALYSIS\n")
-            f.write("-" * 20 + "\n")
-            if latency_data:
-                for test_name, data in latency_data.items():
-                    f.write(f"\n{test_name.replace('ping_', '').replace('_', ' ').title()}:\n")
-                    f.write(f"  Baseline Average: {data['baseline_avg']:.2f}ms\n")
-                    f.write(f"  VPN Average: {data['vpn_avg']:.2f}ms\n")
-                    f.write(f"  Overhead: +{data['overhead_ms']:.2f}ms (+{data['overhead_percent']:.1f}%)\n")
-                    
-                    # Performance rating
-                    if data['overhead_percent'] < 10:
-                        rating = "EXCELLENT"
-                    elif data['overhead_percent'] < 25:
-                        rating = "GOOD"
-                    else:
-                        rating = "NEEDS IMPROVEMENT"
-                    f.write(f"  Rating: {rating}\n")
-            else:
-                f.write("No latency data available\n")
+            lines.append(f"Average Latency Overhead: {avg_latency_overhead:.1f}%\n")
+            lines.append(f"Average Bandwidth Efficiency: {avg_bandwidth_efficiency*100:.1f}%\n")
             
-            # Bandwidth Analysis
-            f.write("\n\nBANDWIDTH ANALYSIS\n")
-            f.write("-" * 20 + "\n")
-            if bandwidth_data:
-                for test_name, data in bandwidth_data.items():
-                    f.write(f"\n{test_name.replace('iperf_', '').replace('_', ' ').title()}:\n")
-                    f.write(f"  Baseline: {data['baseline_mbps']:.2f} Mbps\n")
-                    f.write(f"  VPN: {data['vpn_mbps']:.2f} Mbps\n")
-                    f.write(f"  Efficiency: {data['bandwidth_ratio']*100:.1f}%\n")
-                    
-                    # Performance rating
-                    if data['bandwidth_ratio'] > 0.8:
-                        rating = "EXCELLENT"
-                    elif data['bandwidth_ratio'] > 0.6:
-                        rating = "GOOD"
-                    else:
-                        rating = "NEEDS IMPROVEMENT"
-                    f.write(f"  Rating: {rating}\n")
+            if avg_latency_overhead < 10 and avg_bandwidth_efficiency > 0.8:
+                overall_rating = "EXCELLENT"
+            elif avg_latency_overhead < 25 and avg_bandwidth_efficiency > 0.6:
+                overall_rating = "GOOD"
             else:
-                f.write("No bandwidth data available\n")
-            
-            # Overall Assessment
-            f.write("\n\nOVERALL ASSESSMENT\n")
-            f.write("-" * 20 + "\n")
+                overall_rating = "NEEDS IMPROVEMENT"
             
-            if latency_data and bandwidth_data:
-                avg_latency_overhead = np.mean([d['overhead_percent'] for d in latency_data.values()])
-                avg_bandwidth_efficiency = np.mean([d['bandwidth_ratio'] for d in bandwidth_data.values()])
-                
-                f.write(f"Average Latency Overhead: {avg_latency_overhead:.1f}%\n")
-                f.write(f"Average Bandwidth Efficiency: {avg_bandwidth_efficiency*100:.1f}%\n")
-                
-                if avg_latency_overhead < 10 and avg_bandwidth_efficiency > 0.8:
-                    overall_rating = "EXCELLENT"
-                elif avg_latency_overhead < 25 and avg_bandwidth_efficiency > 0.6:
-                    overall_rating = "GOOD"
-                else:
-                    overall_rating = "NEEDS IMPROVEMENT"
-                
-                f.write(f"Overall Rating: {overall_rating}\n")
-            else:
-                f.write("Insufficient data for overall assessment\n")
+            lines.append(f"Overall Rating: {overall_rating}\n")
+        else:
+            lines.append("Insufficient data for overall assessment\n")
+        
+        with open(report_path, 'w') as f:
+            f.write("".join(lines))
         
         print(f"Comprehensive report saved: {report_path}")
     
     def run_analysis(self, test_type="latest", generate_charts=True):
         """Run complete analysis"""
+        # Share one timestamp across all artifacts of this run
+        now = datetime.now()
+        
         print("Loading test data...")
-        data = self.load_test_data(test_type)
+        # Stream results and keep only tests that have both a baseline and a VPN run
+        paired = _pair_results(self.iter_test_data(test_type))
+        baseline, vpn = paired['baseline'], paired['vpn']
         
         print("Analyzing latency performance...")
-        latency_data = self.analyze_latency(data)
+        latency_data = self.analyze_latency(baseline['ping_'], vpn['ping_'])
         
         print("Analyzing bandwidth performance...")
-        bandwidth_data = self.analyze_bandwidth(data)
+        bandwidth_data = self.analyze_bandwidth(baseline['iperf_'], vpn['iperf_'])
         
         if generate_charts:
             print("Generating charts...")
-            if latency_data:
-                self.generate_latency_chart(latency_data)
-            if bandwidth_data:
-                self.generate_bandwidth_chart(bandwidth_data)
+            self.generate_combined_chart(latency_data, bandwidth_data, now)
         
         print("Generating summary report...")
-        self.generate_summary_report(latency_data, bandwidth_data)
+        self.generate_summary_report(latency_data, bandwidth_data, now)
         
         print("Analysis complete!")
         return {
@@ -342,16 +539,17 @@ def main():
     parser.add_argument('--results-dir', default='../results', help='Results directory path')
     parser.add_argument('--test-type', default='latest', help='Test type to analyze (latest or timestamp)')
     parser.add_argument('--no-charts', action='store_true', help='Skip chart generation')
+    parser.add_argument('--dpi', type=int, default=150, help='Chart resolution in dots per inch')
     
     args = parser.parse_args()
     
-    analyzer = VPNAnalyzer(args.results_dir)
+    analyzer = VPNAnalyzer(args.results_dir, args.dpi)
     results = analyzer.run_analysis(args.test_type, not args.no_charts)
     
     # Print quick summary
-    if results['latency']:
+    if not results['latency'].empty:
         print(f"\nLatency Analysis: {len(results['latency'])} tests analyzed")
-    if results['bandwidth']:
+    if not results['bandwidth'].empty:
         print(f"Bandwidth Analysis: {len(results['bandwidth'])} tests analyzed")
 
 if __name__ == "__main__":